@@ -3,6 +3,8 @@
 This module provides a Regions class.
 """
 
+import numpy as np
+
 from regions.core.core import Region
 from regions.core.registry import RegionsRegistry
 
@@ -25,22 +27,49 @@ class Regions:
     """
 
     def __init__(self, regions=(), /):
-        # if regions == ():
-        #     regions = []
+        if not isinstance(regions, list):
+            regions = list(regions)
         for item in regions:
             if not isinstance(item, Region):
                 raise TypeError('Input regions must be a list of Region '
                                 'objects')
         self.regions = regions
+        self._soa_cache = None
 
     def __getitem__(self, index):
-        newregions = self.regions[index]
-        if isinstance(newregions, Region):  # one item
-            return newregions
+        # 0-d integer arrays are handled as scalar indices
+        if isinstance(index, list) or (isinstance(index, np.ndarray)
+                                       and index.ndim > 0):
+            newregions = self._get_items(index)
         else:
-            newcls = object.__new__(self.__class__)
-            newcls.regions = newregions
-            return newcls
+            newregions = self.regions[index]
+            if not isinstance(index, slice):
+                return newregions  # one item
+
+        newcls = object.__new__(self.__class__)
+        newcls.regions = newregions
+        newcls._soa_cache = None
+        return newcls
+
+    def _get_items(self, index):
+        """
+        Return a list of the regions selected by a boolean mask or an
+        array of integer indices.
+        """
+        index = np.asarray(index)
+        if index.dtype == bool:
+            if index.shape != (len(self.regions),):
+                raise IndexError(f'boolean index has shape {index.shape}, '
+                                 f'but there are {len(self.regions)} '
+                                 'regions')
+            index = np.flatnonzero(index)
+        elif index.size == 0:
+            return []
+        elif index.ndim != 1 or index.dtype.kind not in 'iu':
+            raise IndexError('index arrays must be 1D boolean masks or '
+                             'integer indices')
+
+        return [self.regions[idx] for idx in index.tolist()]
 
     def __repr__(self):
         cls_name = self.__class__.__name__
@@ -52,6 +81,15 @@ class Regions:
     def __len__(self):
         return len(self.regions)
 
+    def __iter__(self):
+        return iter(self.regions)
+
+    def __contains__(self, region):
+        return region in self.regions
+
+    def __bool__(self):
+        return bool(self.regions)
+
     def append(self, region):
         """
         Append the region to the end of the list of regions.
@@ -63,6 +101,7 @@ class Regions:
         """
         if not isinstance(region, Region):
             raise TypeError('Input region must be a Region object')
+        self._soa_cache = None
         self.regions.append(region)
 
     def extend(self, regions):
@@ -75,6 +114,7 @@ class Regions:
         regions : `~regions.Regions` or list of `~regions.Region`
             A `~regions.Regions` object or a list of regions to include.
         """
+        self._soa_cache = None
         if isinstance(regions, Regions):
             self.regions.extend(regions.regions)
         else:
@@ -95,12 +135,14 @@ class Regions:
         region : `~regions.Region`
             The region to insert.
         """
+        self._soa_cache = None
         self.regions.insert(index, region)
 
     def reverse(self):
         """
         Reverse the list of regions in place.
         """
+        self._soa_cache = None
         self.regions.reverse()
 
     def pop(self, index=-1):
@@ -116,6 +158,7 @@ class Regions:
         -------
         result : `~regions.Region`
         """
+        self._soa_cache = None
         return self.regions.pop(index)
 
     def copy(self):
@@ -124,8 +167,98 @@ class Regions:
         """
         newcls = object.__new__(self.__class__)
         newcls.regions = self.regions.copy()
+        newcls._soa_cache = None
         return newcls
 
+    def _get_soa(self):
+        """
+        Return the region data as a struct of arrays.
+
+        The arrays are cached and are rebuilt only if the list of
+        regions, or the center or radius of any region, has changed.
+
+        Returns
+        -------
+        result : dict
+            A dictionary of arrays with one element per region. The
+            ``'lon'`` and ``'lat'`` arrays contain the sky center
+            coordinates (in degrees, in the ``'frame'`` frame) and the
+            ``'radius'`` array contains the angular radius (in
+            degrees). These values are NaN for regions that do not have
+            a sky center or angular radius, or whose center frame is not
+            equivalent to ``'frame'``. The ``'kind'`` array contains the
+            index of each region class in the ``'classes'`` tuple.
+        """
+        from astropy.coordinates import SkyCoord
+
+        key = [(region, getattr(region, 'center', None),
+                getattr(region, 'radius', None)) for region in self.regions]
+
+        soa = self._soa_cache
+        if (soa is not None and len(soa['key']) == len(key)
+                and all(val is cached_val
+                        for item, cached_item in zip(key, soa['key'])
+                        for val, cached_val in zip(item, cached_item))):
+            return soa
+
+        nregions = len(key)
+        lon = np.full(nregions, np.nan)
+        lat = np.full(nregions, np.nan)
+        radius = np.full(nregions, np.nan)
+        kind = np.zeros(nregions, dtype=np.int8)
+
+        frame = None
+        classes = []
+        for idx, (region, center, region_radius) in enumerate(key):
+            if region.__class__ not in classes:
+                classes.append(region.__class__)
+            kind[idx] = classes.index(region.__class__)
+
+            if isinstance(center, SkyCoord) and center.isscalar:
+                if frame is None:
+                    frame = center.frame.replicate_without_data()
+                if frame.is_equivalent_frame(center.frame):
+                    sph = center.spherical
+                    lon[idx] = sph.lon.deg
+                    lat[idx] = sph.lat.deg
+
+            if hasattr(region_radius, 'unit'):
+                radius[idx] = region_radius.to_value('deg')
+
+        self._soa_cache = {'lon': lon, 'lat': lat, 'radius': radius,
+                           'kind': kind, 'frame': frame,
+                           'classes': tuple(classes), 'key': key}
+
+        return self._soa_cache
+
+    def as_skycoord(self):
+        """
+        Return the centers of the regions as a single
+        `~astropy.coordinates.SkyCoord` object.
+
+        Returns
+        -------
+        result : `~astropy.coordinates.SkyCoord`
+            The region centers as an array `~astropy.coordinates.SkyCoord`.
+
+        Raises
+        ------
+        ValueError
+            If any region does not have a sky center, or if the
+            region centers are not defined in the same coordinate frame.
+        """
+        import astropy.units as u
+        from astropy.coordinates import SkyCoord, UnitSphericalRepresentation
+
+        soa = self._get_soa()
+        if soa['frame'] is None or np.any(np.isnan(soa['lon'])):
+            raise ValueError('All regions must have a sky center defined '
+                             'in the same coordinate frame')
+
+        data = UnitSphericalRepresentation(soa['lon'] * u.deg,
+                                           soa['lat'] * u.deg, copy=False)
+        return SkyCoord(soa['frame'].realize_frame(data))
+
     @classmethod
     def get_formats(cls):
         """
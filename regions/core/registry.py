@@ -3,6 +3,9 @@
 This module provides a RegionsRegistry class.
 """
 
+import os
+from collections import OrderedDict
+
 from astropy.table import Table
 
 __all__ = []
@@ -20,6 +23,11 @@ class RegionsRegistry:
 
     registry = {}
 
+    # LRU cache of the formats identified for local files, keyed by
+    # the class, file path, and file modification time and size
+    _format_cache = OrderedDict()
+    _format_cache_max = 128
+
     @classmethod
     def register(cls, classobj, methodname, filetype):
         def inner_wrapper(wrapped_func):
@@ -45,6 +53,30 @@ class RegionsRegistry:
 
     @classmethod
     def identify_format(cls, filename, classobj, methodname):
+        if methodname != 'read':
+            return cls._identify_format(filename, classobj, methodname)
+
+        # only local files can be cached; e.g., URLs are always sniffed
+        try:
+            stat = os.stat(filename)
+        except (OSError, TypeError, ValueError):
+            return cls._identify_format(filename, classobj, methodname)
+
+        key = (classobj, os.path.abspath(filename), stat.st_mtime_ns,
+               stat.st_size)
+        try:
+            format = cls._format_cache[key]
+            cls._format_cache.move_to_end(key)
+        except KeyError:
+            format = cls._identify_format(filename, classobj, methodname)
+            cls._format_cache[key] = format
+            if len(cls._format_cache) > cls._format_cache_max:
+                cls._format_cache.popitem(last=False)
+
+        return format
+
+    @classmethod
+    def _identify_format(cls, filename, classobj, methodname):
         format = None
         identifiers = cls.get_identifiers(classobj)
         if identifiers:
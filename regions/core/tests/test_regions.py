@@ -3,11 +3,18 @@
 Tests for the regions module.
 """
 
+import os
+
+import astropy.units as u
+import numpy as np
 import pytest
+from astropy.coordinates import SkyCoord
 from astropy.table import Table
+from numpy.testing import assert_allclose
 
 from regions.core import PixCoord, Regions
-from regions.shapes import CirclePixelRegion
+from regions.core.registry import RegionsRegistry
+from regions.shapes import CirclePixelRegion, CircleSkyRegion
 
 
 def test_regions_inputs():
@@ -95,6 +102,84 @@ def test_regions_methods():
     assert outreg == reg
 
 
+def test_regions_index_arrays():
+    regs = [CirclePixelRegion(PixCoord(14, 21), radius=radius)
+            for radius in range(1, 5)]
+    regions = Regions(regs)
+
+    mask = np.array([reg.radius > 2 for reg in regions])
+    result = regions[mask]
+    assert isinstance(result, Regions)
+    assert result.regions == regs[2:]
+
+    result = regions[[3, 0, -1]]
+    assert isinstance(result, Regions)
+    assert result.regions == [regs[3], regs[0], regs[3]]
+
+    assert len(regions[[]]) == 0
+    assert regions[np.array(1)] is regs[1]
+
+    with pytest.raises(IndexError):
+        regions[mask[:2]]
+    with pytest.raises(IndexError):
+        regions[np.array([], dtype=bool)]
+    with pytest.raises(IndexError):
+        regions[[0.5, 1.5]]
+    with pytest.raises(IndexError):
+        regions[[10]]
+
+
+def test_regions_tuple_input():
+    regs = (CirclePixelRegion(PixCoord(14, 21), radius=1),)
+    regions = Regions(regs)
+    regions.append(CirclePixelRegion(PixCoord(1, 2), radius=2))
+    assert len(regions) == 2
+
+
+def test_regions_iter_contains():
+    regs = [CirclePixelRegion(PixCoord(14, 21), radius=radius)
+            for radius in range(1, 5)]
+    regions = Regions(regs)
+
+    assert list(regions) == regs
+    assert regs[1] in regions
+    assert CirclePixelRegion(PixCoord(0, 0), radius=1) not in regions
+    assert regions
+    assert not Regions([])
+
+
+def test_regions_as_skycoord():
+    regs = []
+    for idx in range(1, 5):
+        center = SkyCoord(10 * idx, 20 + idx, unit='deg', frame='fk5')
+        regs.append(CircleSkyRegion(center, radius=idx * u.arcsec))
+    regions = Regions(regs)
+
+    skycoord = regions.as_skycoord()
+    assert skycoord.shape == (4,)
+    assert skycoord.frame.name == 'fk5'
+    assert_allclose(skycoord.ra.deg, [10, 20, 30, 40])
+    assert_allclose(skycoord.dec.deg, [21, 22, 23, 24])
+    assert_allclose(regions._get_soa()['radius'] * 3600, [1, 2, 3, 4])
+
+    # cache is updated when a region center changes
+    regions[0].center = SkyCoord(1, 2, unit='deg', frame='fk5')
+    assert_allclose(regions.as_skycoord().ra.deg, [1, 20, 30, 40])
+
+    assert_allclose(regions[1:3].as_skycoord().ra.deg, [20, 30])
+
+    match = 'All regions must have a sky center defined'
+    regions.append(CircleSkyRegion(SkyCoord(1, 2, unit='deg',
+                                            frame='galactic'), 1 * u.deg))
+    with pytest.raises(ValueError, match=match):
+        regions.as_skycoord()
+    regions.pop()
+
+    regions.append(CirclePixelRegion(PixCoord(1, 1), radius=2))
+    with pytest.raises(ValueError, match=match):
+        regions.as_skycoord()
+
+
 def test_regions_get_formats():
     reg = CirclePixelRegion(PixCoord(0, 0), radius=1)
     regions = Regions([reg])
@@ -103,6 +188,31 @@ def test_regions_get_formats():
     assert len(tbl) == 3
 
 
+def test_regions_read_format_cache(tmp_path):
+    filename = tmp_path / 'regions.txt'
+    reg = CircleSkyRegion(SkyCoord(1, 2, unit='deg'), radius=3 * u.deg)
+    Regions([reg]).write(filename, format='ds9')
+
+    def cached_formats():
+        return [fmt for key, fmt in RegionsRegistry._format_cache.items()
+                if key[:2] == (Regions, str(filename))]
+
+    regions = Regions.read(filename)
+    assert len(regions) == 1
+    assert cached_formats() == ['ds9']
+
+    regions = Regions.read(filename)
+    assert len(regions) == 1
+    assert cached_formats() == ['ds9']
+
+    # a modified file is identified again
+    Regions([reg]).write(filename, format='crtf', overwrite=True)
+    os.utime(filename, ns=(0, 0))
+    regions = Regions.read(filename)
+    assert len(regions) == 1
+    assert cached_formats() == ['ds9', 'crtf']
+
+
 def test_regions_repr():
     reg = CirclePixelRegion(PixCoord(0, 0), radius=1)
     regions = Regions([reg])
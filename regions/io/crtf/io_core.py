@@ -314,6 +314,9 @@ class _Shape:
 
     error = RegionConversionError
 
+    __slots__ = ('_coordsys', '_region_type', 'coord', 'meta', 'composite',
+                 'include')
+
     def __init__(self, coordsys, region_type, coord, meta, composite, include):
         self._coordsys = coordsys
         self._region_type = region_type
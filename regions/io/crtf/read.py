@@ -45,6 +45,9 @@ regex_region = re.compile(r'(?P<include>[+-])?(?P<type>ann(?=\s))?\s*(?P<regiont
 # meta attributes from the region format.
 regex_line = re.compile(r'(?P<region>[+-]?(?:ann(?=\s))?\s*[a-z]+?\s?\[[^=]+\])(?:\s*,?\s*(?P<parameters>.*))?')  # noqa: E501
 
+# Numeric value followed by its (optional) unit string, e.g., '50arcsec'
+regex_quantity = re.compile(r'([0-9+,-.]*)(.*)')
+
 
 @RegionsRegistry.register(Regions, 'read', 'crtf')
 def _read_crtf(filename, errors='strict', cache=False):
@@ -516,8 +519,7 @@ class _CRTFCoordinateParser:
                         '"': u.arcsec,
                         "'": u.arcmin}
 
-        regex_str = re.compile(r'([0-9+,-.]*)(.*)')
-        restr = regex_str.search(string_rep)
+        restr = regex_quantity.search(string_rep)
         unit = restr.group(2)
         if unit:
             if unit in unit_mapping:
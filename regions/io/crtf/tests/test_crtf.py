@@ -3,6 +3,8 @@
 Tests for the crtf subpackage.
 """
 
+from collections import Counter
+
 import astropy.units as u
 import pytest
 from astropy.coordinates import Angle, SkyCoord
@@ -128,6 +130,25 @@ def test_issue_312_regression():
     assert crtfstr.strip()[-1] != ','
 
 
+@pytest.fixture(scope='session')
+def crtf_reference_lines():
+    """
+    The lines of the reference CRTF output files, read once per test
+    session.
+
+    Each file is stored as a `~collections.Counter` of the lines, where
+    each line is a frozenset of its comma-separated fields.
+    """
+    reference_lines = {}
+    for outname in ('data/CRTFgeneraloutput.crtf',
+                    'data/CRTF_labelcolor_output.crtf'):
+        with open(get_pkg_data_filename(outname)) as fh:
+            ref_output = fh.read().strip()
+        reference_lines[outname] = Counter(frozenset(line.split(','))
+                                           for line in ref_output.split('\n'))
+    return reference_lines
+
+
 @pytest.mark.parametrize(('filename', 'outname', 'coordsys', 'fmt'),
                          [('data/CRTFgeneral.crtf',
                            'data/CRTFgeneraloutput.crtf',
@@ -138,7 +159,7 @@ def test_issue_312_regression():
                           ('data/CRTF_labelcolor.crtf',
                            'data/CRTF_labelcolor_output.crtf',
                            'fk5', '.6f')])
-def test_file_crtf(filename, outname, coordsys, fmt):
+def test_file_crtf(filename, outname, coordsys, fmt, crtf_reference_lines):
     """
     The "labelcolor" example is a regression test for Issue 405
     The others are just a general serialization self-consistency check.
@@ -148,18 +169,12 @@ def test_file_crtf(filename, outname, coordsys, fmt):
     actual_output = regs.serialize(format='crtf', coordsys=coordsys,
                                    fmt=fmt).strip()
 
-    with open(get_pkg_data_filename(outname)) as fh:
-        ref_output = fh.read().strip()
-
     # since metadata is not required to preserve order, we have to do a more
     # complex comparison
-    desired_lines = [set(line.split(',')) for line in ref_output.split('\n')]
-    actual_lines = [set(line.split(',')) for line in actual_output.split('\n')]
-    for split_line in actual_lines:
-        assert split_line in desired_lines
-
-    for split_line in desired_lines:
-        assert split_line in actual_lines
+    desired_lines = crtf_reference_lines[outname]
+    actual_lines = Counter(frozenset(line.split(','))
+                           for line in actual_output.split('\n'))
+    assert actual_lines == desired_lines
 
 
 def test_crtf_header():
@@ -1,12 +1,18 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import copy
+import functools
+import io
 import re
 import string
+import sys
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import astropy.units as u
-from astropy.coordinates import Angle, SkyCoord
+from astropy.coordinates import (Angle, SkyCoord, UnitSphericalRepresentation,
+                                 frame_transform_graph)
 from astropy.utils.data import get_readable_fileobj
 from astropy.utils.exceptions import AstropyUserWarning
 
@@ -19,6 +25,69 @@ from regions.io.ds9.meta import _split_raw_metadata, _translate_ds9_to_visual
 
 __all__ = []
 
+# Leading include symbol ('+'|'-') and the frame or shape name of a line
+regex_frame_or_shape = re.compile('^#? *([+-]?)([a-zA-Z0-9]+)')
+
+# Extracts each 'key=value' metadata pair:
+# {.*?}    # all chars in curly braces
+# \'.*?\'  # all chars in single quotes
+# \".*?\"  # all chars in double quotes
+# [-?\d+\.?\d*\s]+\s?  # ([-/+]floats [whitespace]) incl. repeats
+#                        (e.g., dashlist=8 3, width=3, textangle=18.35)
+# [^=\s]+\s*[-?\d+\.?\d*]*   # (all chars (e.g., point=diamond) or
+#                              (all chars [whitespace] digits)
+#                                 (e.g., point=diamond 42)
+regex_metadata = re.compile(r'([a-zA-Z]+)\s*=\s*({.*?}|\'.*?\'|\".*?\"|'
+                            r'[-?\d+\.?\d*\s]+\s?|'
+                            r'[^=\s]+\s*[-?\d+\.?\d*]*)')
+
+# Opening delimiter of a text field, e.g., "text={", "text='", 'text="'
+regex_text_delim = re.compile(r'(text\s*=\s*[{\'"])')
+
+# Separators (whitespace or comma) between shape parameters
+regex_param_sep = re.compile(r'\s|\,')
+
+# Shape parameter given as a plain number (i.e., without units or
+# sexagesimal separators)
+regex_number = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?')
+
+# frozensets are used for fast membership tests on each parsed line
+supported_frames = frozenset(('image', 'icrs', 'fk5', 'j2000', 'fk4',
+                              'b1950', 'galactic', 'ecliptic'))
+wcs_frames = frozenset(['wcs', 'wcs0']
+                       + [f'wcs{letter}' for letter in string.ascii_lowercase])
+unsupported_frames = frozenset(('linear', 'amplifier', 'detector',
+                                'physical', 'tile')) | wcs_frames
+
+supported_shapes = frozenset(('circle', 'ellipse', 'box', 'annulus',
+                              'polygon', 'line', 'point', 'text',
+                              'composite'))
+unsupported_shapes = frozenset(('vector', 'ruler', 'compass', 'projection',
+                                'panda', 'epanda', 'bpanda'))
+
+supported_frames_shapes = supported_frames | supported_shapes
+unsupported_frames_shapes = unsupported_frames | unsupported_shapes
+valid_frames_shapes = supported_frames_shapes | unsupported_frames_shapes
+
+# Common metadata keys and values, interned so that the metadata of
+# many regions share the same string objects
+interned_meta_keys = {key: sys.intern(key) for key in (
+    'color', 'dash', 'dashlist', 'font', 'select', 'highlite', 'fixed',
+    'edit', 'move', 'rotate', 'delete', 'include', 'source', 'width',
+    'text', 'tag', 'fill', 'point', 'textangle')}
+interned_meta_values = {value: sys.intern(value) for value in (
+    '0', '1', 'white', 'black', 'red', 'green', 'blue', 'cyan', 'magenta',
+    'yellow', 'orange')}
+
+# LRU cache of parsed region strings; each value is a tuple of the
+# parsed regions and the warnings emitted while parsing them. The cache
+# is bounded both by the number of entries and by the total length of
+# the cached strings, and strings longer than _PARSE_CACHE_MAXLEN are
+# never cached.
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_MAX = 256
+_PARSE_CACHE_MAXLEN = 10_000_000
+
 
 @RegionsRegistry.register(Regions, 'read', 'ds9')
 def _read_ds9(filename, cache=False):
@@ -27,8 +96,9 @@ def _read_ds9(filename, cache=False):
 
     Parameters
     ----------
-    filename : str
-        The filename of the file to access.
+    filename : str or file-like object
+        The filename of the file to access or a file-like object (with
+        a ``read`` method).
 
     cache : bool or 'update', optional
         Whether to cache the contents of remote URLs. If 'update', check
@@ -41,6 +111,10 @@ def _read_ds9(filename, cache=False):
         A `Regions` object containing a list of `~regions.Region`
         objects.
     """
+    # get_readable_fileobj requires file objects opened in binary mode
+    if isinstance(filename, io.TextIOBase):
+        return _parse_ds9(filename.read())
+
     with get_readable_fileobj(filename, cache=cache) as fh:
         region_string = fh.read()
         return _parse_ds9(region_string)
@@ -62,19 +136,118 @@ def _parse_ds9(region_str):
         A `Regions` object containing a list of `~regions.Region`
         objects.
     """
+    try:
+        regions, parse_warnings = _PARSE_CACHE[region_str]
+    except KeyError:
+        # record the parsing warnings so they can be re-emitted when
+        # the same string is parsed again
+        with warnings.catch_warnings(record=True) as parse_warnings:
+            warnings.simplefilter('always')
+            regions = _parse_regions(region_str)
+        _emit_warnings(parse_warnings)
+
+        # cache a separate copy so that changes to the output regions
+        # cannot modify the cached regions
+        if len(region_str) <= _PARSE_CACHE_MAXLEN:
+            _cache_regions(region_str, regions, parse_warnings)
+        return Regions(regions)
+
+    _PARSE_CACHE.move_to_end(region_str)
+    _emit_warnings(parse_warnings)
+    return Regions([_copy_region(region) for region in regions])
+
+
+def _parse_regions(region_str):
+    """
+    Parse a DS9 region string into a list of regions.
+
+    Parameters
+    ----------
+    region_str : str
+        The string contents of a DS9 region file.
+
+    Returns
+    -------
+    regions : list of `~regions.Region`
+        A list of `~regions.Region` objects.
+    """
     # first parse the input string to generate the raw region data
     region_data = _parse_raw_data(region_str)
 
-    # now parse the raw region data into region object(s)
-    regions = []
+    # then parse the shape parameters for all of the regions
+    parsed_data = []
     for region_data_ in region_data:
-        region = _make_region(region_data_)
-        if region is not None:  # skip region if error during parsing
-            regions.extend(region)
-    return Regions(regions)
+        parsed_params = _parse_region_params(region_data_)
+        if parsed_params is not None:  # skip region if error during parsing
+            parsed_data.append((region_data_, *parsed_params))
+
+    # define the sky region centers for all regions at once
+    centers = _define_sky_centers(parsed_data)
+
+    # finally, create the region object(s)
+    regions = []
+    for (region_data_, shape, shape_params_list), center in zip(parsed_data,
+                                                                centers):
+        regions.extend(_make_region(region_data_, shape, shape_params_list,
+                                    center=center))
+    return regions
+
+
+def _copy_region(region):
+    """
+    Make a copy of a parsed region.
+
+    Scalar `~astropy.coordinates.SkyCoord` parameters cannot be modified
+    in place and are shared with the input region. All other mutable
+    parameters (e.g., `~astropy.units.Quantity` and `~regions.PixCoord`)
+    and the metadata are copied.
+    """
+    region_copy = copy.copy(region)
+    for param in region._params:
+        value = getattr(region, param)
+        if ((isinstance(value, SkyCoord) and not value.isscalar)
+                or isinstance(value, (u.Quantity, PixCoord))):
+            # the copied values are already validated, so bypass the
+            # (slow) validation of the region attribute descriptors
+            region_copy.__dict__[param] = value.copy()
+    region_copy.meta = region.meta.copy()
+    region_copy.visual = region.visual.copy()
+    region_copy._raw_meta = copy.deepcopy(region._raw_meta)
+    return region_copy
+
+
+def _cache_regions(region_str, regions, parse_warnings):
+    """
+    Add copies of the parsed regions to the parse cache, evicting the
+    least recently used entries to keep the cache within its bounds.
+    """
+    _PARSE_CACHE[region_str] = ([_copy_region(region) for region in regions],
+                                parse_warnings)
+
+    total_len = sum(len(key) for key in _PARSE_CACHE)
+    while (len(_PARSE_CACHE) > _PARSE_CACHE_MAX
+           or total_len > _PARSE_CACHE_MAXLEN):
+        key, _ = _PARSE_CACHE.popitem(last=False)
+        total_len -= len(key)
 
 
-@dataclass
+def _emit_warnings(parse_warnings):
+    """
+    Emit the recorded parsing warnings.
+    """
+    for warning in parse_warnings:
+        warnings.warn_explicit(warning.message, warning.category,
+                               warning.filename, warning.lineno)
+
+
+def _clear_parse_cache():
+    """
+    Clear the cache of parsed DS9 region strings.
+    """
+    _PARSE_CACHE.clear()
+
+
+@dataclass(slots=True)
 class _RegionData:
     """
     Class to hold data used to initialize a Region object.
@@ -132,25 +305,6 @@ def _parse_raw_data(region_str):
     frame = None
     region_data = []
 
-    supported_frames = ['image', 'icrs', 'fk5', 'j2000', 'fk4', 'b1950',
-                        'galactic', 'ecliptic']
-    unsupported_frames = ['linear', 'amplifier', 'detector', 'physical',
-                          'tile']
-    wcs_frames = ['wcs', 'wcs0'] + [f'wcs{letter}'
-                                    for letter in string.ascii_lowercase]
-    unsupported_frames += wcs_frames
-
-    supported_shapes = ['circle', 'ellipse', 'box', 'annulus', 'polygon',
-                        'line', 'point', 'text', 'composite']
-    unsupported_shapes = ['vector', 'ruler', 'compass', 'projection',
-                          'panda', 'epanda', 'bpanda']
-
-    supported_frames_shapes = supported_frames + supported_shapes
-    unsupported_frames_shapes = unsupported_frames + unsupported_shapes
-    valid_frames_shapes = supported_frames_shapes + unsupported_frames_shapes
-
-    regex_frame_or_shape = re.compile('^#? *([+-]?)([a-zA-Z0-9]+)')
-
     for line in _split_lines(region_str):  # split on semicolons & newlines
         # skip blank lines
         if not line:
@@ -292,7 +446,8 @@ def _parse_shape_line(shape, line, span):
 
     # strip trailing space and | chars
     shape_params_str = shape_params_str.strip(' |')
-    shape_params_str = re.sub('[()]', '', shape_params_str).lower()
+    shape_params_str = (shape_params_str.replace('(', '')
+                        .replace(')', '').lower())
     meta_str = meta_str.strip()
 
     return shape_params_str, meta_str
@@ -312,22 +467,12 @@ def _parse_metadata(metadata_str):
     metadata : dict
         The region metadata as a dictionary.
     """
-    # {.*?}    # all chars in curly braces
-    # \'.*?\'  # all chars in single quotes
-    # \".*?\"  # all chars in double quotes
-    # [-?\d+\.?\d*\s]+\s?  # ([-/+]floats [whitespace]) incl. repeats
-    #                        (e.g., dashlist=8 3, width=3, textangle=18.35)
-    # [^=\s]+\s*[-?\d+\.?\d*]*   # (all chars (e.g., point=diamond) or
-    #                              (all chars [whitespace] digits)
-    #                                 (e.g., point=diamond 42)
-    metadata_regex = re.compile(r'([a-zA-Z]+)\s*=\s*({.*?}|\'.*?\'|\".*?\"|'
-                                r'[-?\d+\.?\d*\s]+\s?|'
-                                r'[^=\s]+\s*[-?\d+\.?\d*]*)')
-
     metadata = {}
-    for key, val in metadata_regex.findall(metadata_str):
+    for key, val in regex_metadata.findall(metadata_str):
         key = key.lower()
+        key = interned_meta_keys.get(key, key)
         val = val.strip().strip("'").strip('"').lstrip('{').rstrip('}')
+        val = interned_meta_values.get(val, val)
         if key not in metadata:
             if key == 'tag':
                 val = [val]  # tag value is always a list
@@ -506,6 +651,21 @@ def _parse_size(region_type, param_str):
         return _parse_angle(param_str)
 
 
+def _make_number_param(region_type, param_type, value):
+    """
+    Define a shape parameter from a number given without units.
+
+    The result is the same as parsing the parameter string with
+    ``_parse_coord``, ``_parse_size``, or ``_parse_angle``.
+    """
+    if param_type == 'angle' or region_type == 'sky':
+        # sky coordinates, sizes, and angles default to degrees
+        return u.Quantity(value, unit=u.degree)
+    if param_type == 'coord':
+        return value - 1  # DS9 uses 1-indexed pixels
+    return value
+
+
 def _parse_shape_params(region_data):
     """
     Parse the shape parameters for a region line.
@@ -527,8 +687,9 @@ def _parse_shape_params(region_data):
     region_type = region_data.region_type
     shape = region_data.shape
     frame = region_data.frame
-    params = [val for val in re.split(r'\s|\,', region_data.shape_params)
-              if val]  # split values on space or comma
+    # split values on space or comma
+    params = [val for val in
+              regex_param_sep.split(region_data.shape_params) if val]
 
     nparams = len(params)
     n_annulus = 0
@@ -548,21 +709,31 @@ def _parse_shape_params(region_data):
     else:
         shape_template = ds9_params_template[shape]
 
+    # parameters given as plain numbers (without units or sexagesimal
+    # separators) are converted directly, skipping the unit parsing
+    values = None
+    if all(regex_number.fullmatch(param) for param in params):
+        values = [float(param) for param in params]
+
     shape_params = []
     for idx, (param_type, value) in enumerate(zip(shape_template, params)):
         if shape in ('ellipse', 'box') and idx == nparams - 1:
             param_type = 'angle'  # last parameter is always an angle
 
-        if param_type == 'coord':
+        if param_type not in ('coord', 'length', 'angle'):
+            raise ValueError('cannot parse shape parameters')
+
+        if values is not None:
+            param = _make_number_param(region_type, param_type, values[idx])
+        elif param_type == 'coord':
             param = _parse_coord(region_type, value, frame, idx)
         elif param_type in ('length',):
             param = _parse_size(region_type, value)
-            if shape == 'ellipse':
-                param *= 2.0  # ds9 uses semi-axis lengths
-        elif param_type in ('angle',):
-            param = _parse_angle(value)
         else:
-            raise ValueError('cannot parse shape parameters')
+            param = _parse_angle(value)
+
+        if param_type == 'length' and shape == 'ellipse':
+            param *= 2.0  # ds9 uses semi-axis lengths
 
         shape_params.append(param)
 
@@ -593,18 +764,85 @@ def _parse_shape_params(region_data):
     return shape, shape_params
 
 
+@functools.cache
+def _get_frame(frame):
+    """
+    Return a (cached) coordinate frame instance without data.
+    """
+    return frame_transform_graph.lookup_name(frame)()
+
+
 def _define_coords(region_type, params, frame=None):
     if region_type == 'pixel':
         coords = PixCoord(*params)
     else:
-        coords = SkyCoord(*params, frame=frame)
+        # realizing a frame instance directly avoids the much slower
+        # input parsing done by the SkyCoord initializer
+        data = UnitSphericalRepresentation(*params)
+        coords = SkyCoord(_get_frame(frame).realize_frame(data))
     return coords
 
 
-def _define_region_params(region_type, shape, shape_params, frame=None):
+def _define_sky_centers(parsed_data):
+    """
+    Define the center coordinates of the sky regions.
+
+    Instead of creating a `~astropy.coordinates.SkyCoord` object for
+    each region, a single `~astropy.coordinates.SkyCoord` object is
+    created for all regions defined in the same frame. Each region
+    center is then a scalar element of that object.
+
+    Parameters
+    ----------
+    parsed_data : list of tuple
+        A list of (`_RegionData`, shape, shape parameters list) tuples.
+
+    Returns
+    -------
+    centers : list
+        A list of the `~astropy.coordinates.SkyCoord` region centers.
+        The list element is `None` for regions that do not have a
+        center (e.g., polygons), pixel regions, multi-annulus regions,
+        and regions whose center is not given in degrees.
+    """
+    centers = [None] * len(parsed_data)
+
+    frame_groups = {}
+    for idx, parsed_data_ in enumerate(parsed_data):
+        region_data, shape, shape_params_list = parsed_data_
+        if (region_data.region_type != 'sky'
+                or shape in ('polygon', 'line')
+                or len(shape_params_list) != 1
+                or len(shape_params_list[0]) < 2):
+            continue
+
+        lon, lat = shape_params_list[0][0:2]
+        # do not change the units of the input coordinates
+        if lon.unit != u.deg or lat.unit != u.deg:
+            continue
+
+        frame_groups.setdefault(region_data.frame, []).append((idx, lon.value,
+                                                               lat.value))
+
+    for frame, group in frame_groups.items():
+        indices, lon, lat = zip(*group)
+        coords = _define_coords('sky', (u.Quantity(lon, u.deg),
+                                        u.Quantity(lat, u.deg)),
+                                frame=ds9_frame_map[frame])
+        for idx, coord in zip(indices, coords):
+            centers[idx] = coord
+
+    return centers
+
+
+def _define_region_params(region_type, shape, shape_params, frame=None,
+                          center=None):
     if frame is not None:
         frame = ds9_frame_map[frame]
 
+    if center is None and shape not in ('polygon', 'line'):
+        center = _define_coords(region_type, shape_params[0:2], frame=frame)
+
     if shape == 'polygon':
         coord_params = (shape_params[0::2], shape_params[1::2])
         params = [_define_coords(region_type, coord_params, frame=frame)]
@@ -617,29 +855,67 @@ def _define_region_params(region_type, shape, shape_params, frame=None):
         size_params = shape_params[2:-1]
         tmp = [size_params[0::2], size_params[1::2]]
         tmp_flat = [item for sublist in tmp for item in sublist]
-        params = [_define_coords(region_type, shape_params[0:2], frame=frame),
-                  *tmp_flat, shape_params[-1]]
+        params = [center, *tmp_flat, shape_params[-1]]
 
     else:
-        params = ([_define_coords(region_type, shape_params[0:2],
-                                  frame=frame)] + shape_params[2:])
+        params = [center] + shape_params[2:]
 
     return params
 
 
-def _make_region(region_data):
+def _parse_region_params(region_data):
     """
+    Parse the shape parameters for a region line, skipping the region
+    (with a warning) if they cannot be parsed.
+
+    Parameters
+    ----------
     region_data : `_RegionData` instance
+        A `_RegionData` instance containing the data for a region line.
+
+    Returns
+    -------
+    result : tuple or `None`
+        A tuple of the region shape and the list of shape parameters
+        returned by ``_parse_shape_params``. `None` is returned if the
+        shape parameters could not be parsed.
     """
     try:
         # NOTE: returned shape can be different from region_data.shape
-        shape, shape_params_list = _parse_shape_params(region_data)
+        return _parse_shape_params(region_data)
     except DS9ParserError as err:
         # raise a warning and skip the region
         msg = f'{str(err)}: {region_data.region_str}'
         warnings.warn(msg, AstropyUserWarning)
         return None
 
+
+def _make_region(region_data, shape, shape_params_list, center=None):
+    """
+    Create the region object(s) for a region line.
+
+    Parameters
+    ----------
+    region_data : `_RegionData` instance
+        A `_RegionData` instance containing the data for a region line.
+
+    shape : str
+        The region shape, as returned by ``_parse_shape_params``.
+
+    shape_params_list : list of list(s)
+        The shape parameters for each region, as returned by
+        ``_parse_shape_params``.
+
+    center : `~astropy.coordinates.SkyCoord`, optional
+        The predefined region center. If `None`, the center is defined
+        from the shape parameters.
+
+    Returns
+    -------
+    regions : list of `~regions.Region`
+        The region object(s). Multi-annulus regions are split into
+        separate regions.
+    """
     # define the parameters to initialize a Region
     # NOTE: region_params can be longer than region_data for
     # multi-annulus regions
@@ -648,7 +924,8 @@ def _make_region(region_data):
     for shape_params in shape_params_list:
         region_params.extend([_define_region_params(region_type, shape,
                                                     shape_params,
-                                                    region_data.frame)])
+                                                    region_data.frame,
+                                                    center=center)])
 
     # separate the metadata and visual metadata and then translate the
     # visual metadata to valid mpl kwargs for the particular region
@@ -680,11 +957,10 @@ def _find_text_delim_idx(region_str):
     Find the indices of the DS9 text field delimiters ({}, '', or "") in
     a string.
     """
-    pattern = re.compile(r'(text\s*=\s*[{\'"])')
     idx0 = []
     delim = []
     start_idx = []
-    for match in pattern.finditer(region_str):
+    for match in regex_text_delim.finditer(region_str):
         idx0.append(match.start())
         end_delim = match.group()[-1]
         if end_delim == '{':
@@ -699,6 +975,21 @@ def _find_text_delim_idx(region_str):
     return idx0, idx1
 
 
+def _find_char_idx(region_str, char):
+    """
+    Find the indices of all occurrences of a character in a string.
+
+    This uses `str.find` to scan the string instead of checking each
+    character in Python.
+    """
+    indices = []
+    idx = region_str.find(char)
+    while idx != -1:
+        indices.append(idx)
+        idx = region_str.find(char, idx + 1)
+    return indices
+
+
 def _split_semicolon(region_str):
     r"""
     Split a DS9 region string on semicolons.
@@ -727,9 +1018,13 @@ def _split_semicolon(region_str):
     found at indices between the open/close delimiter indices are
     excluded from splitting.
     """
+    # most lines do not contain a semicolon
+    if ';' not in region_str:
+        return [region_str]
+
     idx0, idx1 = _find_text_delim_idx(region_str)
 
-    semi_idx = [pos for pos, char in enumerate(region_str) if char == ';']
+    semi_idx = _find_char_idx(region_str, ';')
     fidx = []
     for i in semi_idx:
         for i0, i1 in zip(idx0, idx1):
@@ -5,40 +5,46 @@ Tests for the ds9 subpackage.
 
 import os
 import warnings
+from io import BytesIO, StringIO
 
 import astropy.units as u
 import pytest
 from astropy.coordinates import Angle, SkyCoord
 from astropy.tests.helper import assert_quantity_allclose
-from astropy.utils.data import get_pkg_data_filenames
+from astropy.utils.data import get_pkg_data_filename, get_pkg_data_filenames
 from astropy.utils.exceptions import AstropyUserWarning
 from numpy.testing import assert_allclose, assert_equal
 
 from regions._utils.optional_deps import HAS_MATPLOTLIB
 from regions.core import PixCoord, Regions, RegionVisual
+from regions.io.ds9 import read
+from regions.io.ds9.write import _serialize_region_ds9
 from regions.shapes import (CirclePixelRegion, CircleSkyRegion,
                             PointPixelRegion, RegularPolygonPixelRegion,
                             TextPixelRegion)
 from regions.tests.helpers import assert_region_allclose
 
 
-def test_roundtrip(tmpdir):
-    filenames = get_pkg_data_filenames('data', pattern='*.reg')
+@pytest.mark.parametrize('filename',
+                         sorted(os.path.basename(filename) for filename in
+                                get_pkg_data_filenames('data',
+                                                       pattern='*.reg')))
+def test_roundtrip(tmpdir, filename):
+    filename = get_pkg_data_filename(os.path.join('data', filename))
 
     # AstropyUserWarning will be emitted only for some of the files
     with warnings.catch_warnings():
         warnings.simplefilter('ignore', AstropyUserWarning)
         # Check that all test files are readable
-        for filename in filenames:
-            regions = Regions.read(filename, format='ds9')
-            assert len(regions) > 0
+        regions = Regions.read(filename, format='ds9')
+        assert len(regions) > 0
 
-            tempfile = tmpdir.join('tmp.ds9').strpath
-            regions.write(tempfile, format='ds9', overwrite=True, precision=20)
-            regions2 = Regions.read(tempfile, format='ds9')
-            assert len(regions2) > 0
-            for reg1, reg2 in zip(regions, regions2):
-                assert_region_allclose(reg1, reg2)
+        tempfile = tmpdir.join('tmp.ds9').strpath
+        regions.write(tempfile, format='ds9', overwrite=True, precision=20)
+        regions2 = Regions.read(tempfile, format='ds9')
+        assert len(regions2) > 0
+        for reg1, reg2 in zip(regions, regions2):
+            assert_region_allclose(reg1, reg2)
 
 
 def test_serialize():
@@ -54,6 +60,26 @@ def test_serialize():
     assert actual == expected
 
 
+def test_serialize_circles():
+    """
+    Test that serializing many sky circles at once matches the
+    serialization of each region.
+    """
+    radii = [1.e-3, 0.36, 7.2, 3600, 1.e12] * u.arcsec
+    regions = Regions([CircleSkyRegion(SkyCoord(10 * i, 5 * i, unit='deg',
+                                                frame='galactic'), radius)
+                       for i, radius in enumerate(radii)])
+    regions[1].visual['color'] = 'red'
+
+    for precision in (0, 4, 8):
+        lines = regions.serialize(format='ds9',
+                                  precision=precision).splitlines()
+        assert lines[1] == 'galactic'
+        for region, line in zip(regions, lines[2:]):
+            data = _serialize_region_ds9(region, precision=precision)
+            assert line.startswith(data['region'])
+
+
 def test_serialize_parse_text():
     """
     Test serialization of Text region.
@@ -113,6 +139,30 @@ def test_read_write(tmpdir):
     assert region2.meta['text'] == 'ExampleText'
 
 
+@pytest.mark.parametrize('buffer_cls', [StringIO, BytesIO])
+def test_read_write_fileobj(buffer_cls):
+    """
+    Test write and read using file-like objects.
+    """
+    center = SkyCoord(42, 43, unit='deg', frame='fk5')
+    radius = Angle(3, 'deg')
+    region = CircleSkyRegion(center, radius)
+    region.meta['text'] = 'ExampleText'
+
+    output = StringIO()
+    region.write(output, format='ds9')
+
+    region_str = output.getvalue()
+    if buffer_cls is BytesIO:
+        region_str = region_str.encode()
+    region2 = Regions.read(buffer_cls(region_str), format='ds9')[0]
+
+    assert_quantity_allclose(region2.center.ra, 42 * u.deg)
+    assert_quantity_allclose(region2.center.dec, 43 * u.deg)
+    assert_quantity_allclose(region2.radius, 3 * u.deg)
+    assert region2.meta['text'] == 'ExampleText'
+
+
 def test_invalid_region_warns():
     ds9_str = ('# Region file format: DS9 astropy/regions\nfk5\n'
                'circle(42.0000,43.0000,3.0000)\ninvalidregion(blah)')
@@ -123,6 +173,97 @@ def test_invalid_region_warns():
     assert len(warn_results) == 1
 
 
+@pytest.fixture(name='parse_cache')
+def fixture_parse_cache():
+    """
+    Start and end each test with an empty DS9 parse cache.
+    """
+    read._clear_parse_cache()
+    yield read._PARSE_CACHE
+    read._clear_parse_cache()
+
+
+def test_parse_cache(parse_cache):
+    """
+    Test that repeated parsing of a string returns independent regions
+    and re-emits the parsing warnings.
+    """
+    ds9_str = ('# Region file format: DS9 astropy/regions\nfk5\n'
+               'circle(42.0000,43.0000,3.0000) # color=red tag={a}\n'
+               'image\ncircle(1,2,3)\n'
+               'invalidregion(blah)')
+
+    def modify(regions):
+        regions[0].visual['edgecolor'] = 'blue'
+        regions[0].meta['label'] = 'changed'
+        regions[0].meta['tag'].append('b')
+        regions[0]._raw_meta['tag'].append('b')
+        regions[0].radius *= 2
+        regions[1].center.x = 999
+        regions[1].radius *= 2
+
+    # modify both the regions returned before and after caching
+    for _ in range(2):
+        with pytest.warns(AstropyUserWarning) as warn_results:
+            regions = Regions.parse(ds9_str, format='ds9')
+        assert len(warn_results) == 1
+        modify(regions)
+    assert len(parse_cache) == 1
+
+    with pytest.warns(AstropyUserWarning) as warn_results:
+        regions2 = Regions.parse(ds9_str, format='ds9')
+    assert len(warn_results) == 1
+    assert len(regions2) == 2
+    assert regions2[0].visual['edgecolor'] == 'red'
+    assert 'label' not in regions2[0].meta
+    assert regions2[0].meta['tag'] == ['a']
+    assert regions2[0]._raw_meta['tag'] == ['a']
+    assert regions2[0].radius == 3 * u.deg
+    assert regions2[1].center == PixCoord(0, 1)
+    assert regions2[1].radius == 3
+    assert regions2[0] is not regions[0]
+
+
+def test_parse_cache_maxlen(parse_cache, monkeypatch):
+    """
+    Test that the parse cache is bounded by the total length of the
+    cached strings.
+    """
+    monkeypatch.setattr(read, '_PARSE_CACHE_MAXLEN', 40)
+    ds9_str1 = 'fk5\ncircle(1,2,3)\n'
+    ds9_str2 = 'fk5\ncircle(4,5,6)\n'
+    ds9_str3 = 'fk5\ncircle(7,8,9)\n' * 3
+
+    Regions.parse(ds9_str1, format='ds9')
+    Regions.parse(ds9_str2, format='ds9')
+    assert list(parse_cache) == [ds9_str1, ds9_str2]
+    Regions.parse(ds9_str1, format='ds9')
+    Regions.parse(ds9_str2 * 2, format='ds9')
+    assert list(parse_cache) == [ds9_str2 * 2]
+    Regions.parse(ds9_str3, format='ds9')
+    assert list(parse_cache) == [ds9_str2 * 2]
+
+
+def test_parse_mixed_frames():
+    """
+    Test that the centers of many regions in different frames are
+    assigned to the correct regions.
+    """
+    region_str = ('fk5\ncircle(1,2,3)\ngalactic\npoint(4,5)\n'
+                  'fk5\nbox(6,7,1,1,0)\ncircle(1h,2d,3)\n'
+                  'galactic\nannulus(8,9,1,2,3)')
+    regions = Regions.parse(region_str, format='ds9')
+    assert len(regions) == 6
+
+    frames = [region.center.frame.name for region in regions]
+    assert frames == ['fk5', 'galactic', 'fk5', 'fk5', 'galactic',
+                      'galactic']
+    lon = [region.center.spherical.lon.deg for region in regions]
+    assert_allclose(lon, [1, 4, 6, 15, 8, 8])
+    lat = [region.center.spherical.lat.deg for region in regions]
+    assert_allclose(lat, [2, 5, 7, 2, 9, 9])
+
+
 def test_global_parser():
     """
     Test parsing global metadata.
@@ -150,10 +291,10 @@ def test_meta_color():
                   'circle(43.0000,43.0000,3.0000) # color=orange\n')
     regions = Regions.parse(region_str, format='ds9')
 
-    assert regions[0].visual['facecolor'] == 'green'
-    assert regions[0].visual['edgecolor'] == 'green'
-    assert regions[1].visual['facecolor'] == 'orange'
-    assert regions[1].visual['edgecolor'] == 'orange'
+    facecolors = [region.visual['facecolor'] for region in regions]
+    edgecolors = [region.visual['edgecolor'] for region in regions]
+    assert facecolors == ['green', 'orange']
+    assert edgecolors == ['green', 'orange']
 
 
 def test_meta_color_override_global():
@@ -168,9 +309,8 @@ def test_meta_color_override_global():
                   'circle(42.0000,43.0000,5.0000) # color=orange\n'
                   'circle(42.0000,43.0000,7.0000)')
     regions = Regions.parse(region_str, format='ds9')
-    assert regions[0].visual['facecolor'] == 'green'
-    assert regions[1].visual['facecolor'] == 'orange'
-    assert regions[2].visual['facecolor'] == 'blue'
+    facecolors = [region.visual['facecolor'] for region in regions]
+    assert facecolors == ['green', 'orange', 'blue']
 
 
 def test_issue134_regression():
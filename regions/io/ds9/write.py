@@ -1,10 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import functools
 import os
 import warnings
 from copy import deepcopy
 
-from astropy.coordinates import Angle, SkyCoord
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import (Angle, SkyCoord,
+                                 UnitSphericalRepresentation)
 from astropy.units import Quantity
 from astropy.utils.exceptions import AstropyUserWarning
 
@@ -13,7 +17,7 @@ from regions.core import (CompoundPixelRegion, CompoundSkyRegion, PixCoord,
 from regions.core.registry import RegionsRegistry
 from regions.io.ds9.core import ds9_frame_map, ds9_shape_templates
 from regions.io.ds9.meta import _translate_metadata_to_ds9
-from regions.shapes import RegularPolygonPixelRegion
+from regions.shapes import CircleSkyRegion, RegularPolygonPixelRegion
 
 __all__ = []
 
@@ -24,16 +28,19 @@ def _serialize_ds9(regions, precision=8):
     # if not regions:
     #     return ''
 
-    region_data = []
-    for region in regions:
-        if isinstance(region, (CompoundPixelRegion, CompoundSkyRegion)):
-            warnings.warn('Cannot serialize a compound region, skipping',
-                          AstropyUserWarning)
+    region_data = _serialize_circles_ds9(regions, precision=precision)
+    if region_data is None:
+        region_data = []
+        for region in regions:
+            if isinstance(region, (CompoundPixelRegion, CompoundSkyRegion)):
+                warnings.warn('Cannot serialize a compound region, skipping',
+                              AstropyUserWarning)
 
-        if isinstance(region, RegularPolygonPixelRegion):
-            region = region.to_polygon()
+            if isinstance(region, RegularPolygonPixelRegion):
+                region = region.to_polygon()
 
-        region_data.append(_serialize_region_ds9(region, precision=precision))
+            region_data.append(_serialize_region_ds9(region,
+                                                     precision=precision))
 
     # ds9 file header
     output = '# Region file format: DS9 astropy/regions\n'
@@ -95,8 +102,9 @@ def _write_ds9(regions, filename, *, precision=8, overwrite=False):
     regions : list
         A list of `~regions.Region` objects.
 
-    filename : str
-        The output region filename.
+    filename : str or file-like object
+        The output region filename or a file-like object (with a
+        ``write`` method) opened in text mode.
 
     precision : int, optional
         The level of decimal precision given as the number of decimal
@@ -105,13 +113,18 @@ def _write_ds9(regions, filename, *, precision=8, overwrite=False):
     overwrite : bool, optional
         If `True`, overwrite the output file if it exists. If `False`
         (default) and the output file exists, an `OSError` is raised.
+        Not used if ``filename`` is a file-like object.
     """
-    if os.path.lexists(filename) and not overwrite:
+    is_fileobj = hasattr(filename, 'write')
+    if not is_fileobj and os.path.lexists(filename) and not overwrite:
         raise OSError(f'{filename} already exists')
 
     output = _serialize_ds9(regions, precision=precision)
-    with open(filename, 'w') as fh:
-        fh.write(output)
+    if is_fileobj:
+        filename.write(output)
+    else:
+        with open(filename, 'w') as fh:
+            fh.write(output)
 
 
 def _get_region_shape(region):
@@ -232,3 +245,77 @@ def _serialize_region_ds9(region, precision=8):
     region_meta = _translate_metadata_to_ds9(region, shape)
 
     return {'frame': frame, 'region': region_str, 'meta': region_meta}
+
+
+def _serialize_circles_ds9(regions, precision=8):
+    """
+    Serialize a list of `~regions.CircleSkyRegion` objects that are all
+    defined in the same coordinate frame.
+
+    The region parameters for all regions are formatted at once using
+    array operations instead of formatting each region separately.
+
+    Parameters
+    ----------
+    regions : list of `~regions.Region`
+        A list of regions.
+
+    precision : int, optional
+        The level of decimal precision given as the number of decimal
+        places.
+
+    Returns
+    -------
+    region_data : list of dict or `None`
+        The serialized data for each region, in the same form as
+        returned by ``_serialize_region_ds9``. `None` is returned if
+        the regions are not all `~regions.CircleSkyRegion` objects
+        defined in the same coordinate frame.
+    """
+    # Quantity.to_string keeps the decimal point for precision=0
+    # (e.g., "1."), which the array formatting does not reproduce
+    if precision < 1 or not regions:
+        return None
+
+    if any(type(region) is not CircleSkyRegion for region in regions):
+        return None
+
+    nregions = len(regions)
+    lon = np.empty(nregions)
+    lat = np.empty(nregions)
+    radius = np.empty(nregions)
+    center_frame = regions[0].center.frame
+    for idx, region in enumerate(regions):
+        if not center_frame.is_equivalent_frame(region.center.frame):
+            return None
+        center = region.center.represent_as(UnitSphericalRepresentation)
+        lon[idx] = center.lon.to_value(u.deg)
+        lat[idx] = center.lat.to_value(u.deg)
+        radius[idx] = region.radius.to_value(u.deg)
+
+    frame_mapping = {v: k for k, v in ds9_frame_map.items()}
+    frame = _get_frame_name(regions[0], mapping=frame_mapping)
+
+    fmt = f'%.{precision}f'
+    lon = np.char.mod(fmt, lon)
+    lat = np.char.mod(fmt, lat)
+
+    # Quantity.to_string uses exponential notation for very small or
+    # large values; format those radii individually
+    abs_radius = np.abs(radius)
+    is_positional = ((radius == 0)
+                     | ((abs_radius >= 1.e-4) & (abs_radius < 1.e8)))
+    radius_str = np.char.mod(fmt, radius).astype(object)
+    for idx in np.nonzero(~is_positional)[0]:
+        # [:-4] to trim ' deg' from string end
+        radius_str[idx] = regions[idx].radius.to_string(
+            unit='deg', precision=precision)[:-4]
+
+    region_type = ds9_shape_templates['circle'][0]
+    parts = (f'{region_type}(', lon, ',', lat, ',', radius_str.astype(str),
+             ')')
+    region_strs = functools.reduce(np.char.add, parts)
+
+    return [{'frame': frame, 'region': str(region_str),
+             'meta': _translate_metadata_to_ds9(region, 'circle')}
+            for region, region_str in zip(regions, region_strs)]